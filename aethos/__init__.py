@@ -16,12 +16,15 @@ if not os.path.exists(config_home):
         os.path.join(pkg_directory, "config", "config.yml"), os.path.join(config_home)
     )
 
+import importlib
+import sys
+
 import pandas as pd
-from IPython import get_ipython
 import plotly.io as pio
 
 # let init-time option registration happen
 import aethos.config.config_init
+from aethos.config import shell
 from aethos.config.config import (
     describe_option,
     get_option,
@@ -30,17 +33,6 @@ from aethos.config.config import (
     set_option,
 )
 
-from aethos.helpers import groupby_analysis
-
-from aethos.analysis import Analysis
-from aethos.modelling import Classification, Regression, Unsupervised
-from aethos.model_analysis import (
-    ClassificationModelAnalysis,
-    RegressionModelAnalysis,
-    UnsupervisedModelAnalysis,
-    TextModelAnalysis,
-)
-
 pd.options.mode.chained_assignment = None
 pio.templates.default = "plotly_white"
 
@@ -49,13 +41,47 @@ __all__ = [
     "Classification",
     "Regression",
     "Unsupervised",
-    "ClassificationModelAnalsysis",
+    "ClassificationModelAnalysis",
     "RegressionModelAnalysis",
     "UnsupervisedModelAnalysis",
     "TextModelAnalysis",
 ]
 
-shell = get_ipython().__class__.__name__
+# The analysis and modelling modules pull in most of the ML stack, so they are only
+# imported the first time one of their classes is used.
+_LAZY_IMPORTS = {
+    "groupby_analysis": "aethos.helpers",
+    "Analysis": "aethos.analysis",
+    "Classification": "aethos.modelling",
+    "Regression": "aethos.modelling",
+    "Unsupervised": "aethos.modelling",
+    "ClassificationModelAnalysis": "aethos.model_analysis",
+    "RegressionModelAnalysis": "aethos.model_analysis",
+    "UnsupervisedModelAnalysis": "aethos.model_analysis",
+    "TextModelAnalysis": "aethos.model_analysis",
+}
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+
+        if name not in _LAZY_IMPORTS:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        attr = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = attr
+
+        return attr
+
+    def __dir__():
+
+        return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
+
+else:  # pragma: no cover
+    # Module level __getattr__ needs python 3.7 (PEP 562), import everything up front.
+    for _name, _module in _LAZY_IMPORTS.items():
+        globals()[_name] = getattr(importlib.import_module(_module), _name)
 
 if shell == "ZMQInteractiveShell":
     import shap
@@ -1,6 +1,11 @@
 import numpy as np
+import pandas as pd
 from aethos.util import _get_columns
 
+# Integer type numeric category columns are converted to, columns with values outside
+# of its range fall back to int64.
+_CATEGORY_INT_DTYPE = np.int32
+
 
 def replace_missing_new_category(
     x_train, x_test=None, col_to_category=None, constant=None
@@ -44,52 +49,128 @@ def replace_missing_new_category(
 
     if isinstance(col_to_category, dict):
 
-        for col in col_to_category.keys():
-            x_train[col].fillna(col_to_category[col], inplace=True)
+        # DataFrame.fillna skips keys that aren't columns, so check them up front
+        for df in (x_train, x_test):
+            if df is not None and not set(col_to_category).issubset(df.columns):
+                raise KeyError(
+                    f"Columns {set(col_to_category).difference(df.columns)} are not in the data."
+                )
+
+        x_train.fillna(col_to_category, inplace=True)
 
-            if x_test is not None:
-                x_test[col].fillna(col_to_category[col], inplace=True)
+        if x_test is not None:
+            x_test.fillna(col_to_category, inplace=True)
 
     elif isinstance(col_to_category, list) and constant is not None:
 
-        for col in col_to_category:
-            x_train[col].fillna(constant, inplace=True)
+        constant_categories = {col: constant for col in col_to_category}
 
-            if x_test is not None:
-                x_test[col].fillna(constant, inplace=True)
+        x_train.fillna(constant_categories, inplace=True)
 
-    else:
+        if x_test is not None:
+            x_test.fillna(constant_categories, inplace=True)
 
-        for col in col_to_category:
-            # Check if column is a number
-            if np.issubdtype(x_train[col].dtype, np.number):
-                new_category_name = _determine_default_category(
-                    x_train, col, num_missing_categories
-                )
-                x_train[col].fillna(new_category_name, inplace=True)
-
-                # Convert numeric categorical column to integer
-                x_train[col] = x_train[col].astype(int)
-
-                if x_test is not None:
-                    x_test[col].fillna(new_category_name, inplace=True)
-                    # Convert numeric categorical column to integer
-                    x_test[col] = x_test[col].astype(int)
-            else:
-                new_category_name = _determine_default_category(
-                    x_train, col, str_missing_categories
-                )
-                x_train[col].fillna(new_category_name, inplace=True)
+    else:
 
-                if x_test is not None:
-                    new_category_name = _determine_default_category(
-                        x_train, col, str_missing_categories
-                    )
-                    x_test[col].fillna(new_category_name, inplace=True)
+        # Check which columns are numbers, their missing values get a numeric category
+        num_cols = [
+            col
+            for col in col_to_category
+            if np.issubdtype(x_train[col].dtype, np.number)
+        ]
+
+        # Columns without missing values don't need a category
+        missing_cols = [
+            col
+            for col in col_to_category
+            if x_train[col].isna().any()
+            or (x_test is not None and x_test[col].isna().any())
+        ]
+
+        new_categories = {
+            col: _determine_default_category(
+                x_train,
+                col,
+                num_missing_categories if col in num_cols else str_missing_categories,
+            )
+            for col in missing_cols
+        }
+
+        str_categories = {
+            col: category
+            for col, category in new_categories.items()
+            if col not in num_cols
+        }
+
+        x_train.fillna(str_categories, inplace=True)
+
+        if x_test is not None:
+            x_test.fillna(str_categories, inplace=True)
+
+        datasets = [x_train] if x_test is None else [x_train, x_test]
+
+        for col in num_cols:
+            # Both datasets get the same integer type so the column stays consistent
+            dtype = _category_int_dtype([df[col] for df in datasets])
+
+            # Fill and convert numeric categorical column to integer in one pass
+            for df in datasets:
+                df[col] = _fill_int_category(df[col], new_categories.get(col), dtype)
 
     return x_train, x_test
 
 
+def _category_int_dtype(columns):
+    """
+    Picks the integer type a numeric category column is converted to, int64 if any of the
+    values in the columns don't fit in the default type.
+    """
+
+    dtype_info = np.iinfo(_CATEGORY_INT_DTYPE)
+
+    for x in columns:
+        values = x.to_numpy()
+        present = ~np.isnan(values)
+
+        if (
+            values.min(where=present, initial=0) < dtype_info.min
+            or values.max(where=present, initial=0) > dtype_info.max
+        ):
+            return np.int64
+
+    return _CATEGORY_INT_DTYPE
+
+
+def _fill_int_category(x, category, dtype):
+    """
+    Fills the missing values of a numeric column with its category and converts it to dtype.
+
+    The values are cast straight into the integer array, so no filled float copy of the
+    column is made along the way.
+    """
+
+    values = x.to_numpy()
+    missing = np.isnan(values)
+
+    if category is None and missing.any():
+        raise ValueError(
+            f"Column {x.name} already has every default category, please provide one."
+        )
+
+    if np.isinf(values).any():
+        raise ValueError(
+            f"Column {x.name} has infinite values that cannot be converted to integers."
+        )
+
+    filled = np.empty(values.shape, dtype=dtype)
+    np.copyto(filled, values, casting="unsafe", where=~missing)
+
+    if category is not None:
+        filled[missing] = category
+
+    return filled
+
+
 def _determine_default_category(x_train, col, replacement_categories):
     """
     A utility function to help determine the default category name for a column that has missing
@@ -99,12 +180,10 @@ def _determine_default_category(x_train, col, replacement_categories):
     that is not a value in the column is the category that will be used to replace missing values.
     """
 
-    unique_vals_col = x_train[col].unique()
+    unique_vals_col = set(pd.unique(x_train[col].to_numpy()))
+
     for potential_category in replacement_categories:
 
         # If the potential category is not already a category, it becomes the default missing category
         if potential_category not in unique_vals_col:
-            new_category_name = potential_category
-            break
-
-    return new_category_name
+            return potential_category
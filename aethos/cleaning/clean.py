@@ -404,10 +404,10 @@ class Clean(object):
         # If a list of columns is provided use the list, otherwise use arguemnts.
         list_of_cols = _input_columns(list_args, list_of_cols)
 
-        self.x_train = self.x_train.dropna(axis=0, subset=list_of_cols)
+        self.x_train = util.drop_rows_missing(self.x_train, list_of_cols)
 
         if self.x_test is not None:
-            self.x_test = self.x_test.dropna(axis=0, subset=list_of_cols)
+            self.x_test = util.drop_rows_missing(self.x_test, list_of_cols)
 
         return self
 
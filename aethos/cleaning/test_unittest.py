@@ -118,6 +118,32 @@ class TestCleaning(unittest.TestCase):
 
         self.assertListEqual(validate, np.array([(1, 0, 2)]).tolist())
 
+    def test_cleancategorical_removerow_nomissing(self):
+
+        int_missing_data = [[1, 0, 2], [1, np.nan, 1], [2, np.nan, np.nan]]
+
+        columns = ["col1", "col2", "col3"]
+        data = pd.DataFrame(int_missing_data, columns=columns)
+
+        clean = Classification(x_train=data, target="col3", x_test=data)
+        clean.replace_missing_remove_row("col1")
+        validate = clean.x_train.fillna(-1).values.tolist()
+
+        self.assertIs(clean.x_train, data)
+        self.assertListEqual(validate, [[1, 0, 2], [1, -1, 1], [2, -1, -1]])
+
+    def test_cleancategorical_removerow_testdatamissing(self):
+
+        columns = ["col1", "col2", "col3"]
+        train_data = pd.DataFrame([[1, 0, 2], [1, 2, 1]], columns=columns)
+        test_data = pd.DataFrame([[1, 0, 2], [np.nan, 2, 1]], columns=columns)
+
+        clean = Classification(x_train=train_data, target="col3", x_test=test_data)
+        clean.replace_missing_remove_row("col1")
+
+        self.assertIs(clean.x_train, train_data)
+        self.assertListEqual(clean.x_test.values.tolist(), [[1, 0, 2]])
+
     def test_cleancategorical_replacemissingnewcategory_dict(self):
 
         missing_data = [[1, "Green", 2], [1, np.nan, 1], [np.nan, np.nan, 1]]
@@ -134,6 +160,19 @@ class TestCleaning(unittest.TestCase):
             validate, [[1.0, "Green", 2.0], [1.0, "Blue", 1.0], [2.0, "Blue", 1]]
         )
 
+    def test_cleancategorical_replacemissingnewcategory_dict_unknowncolumn(self):
+
+        missing_data = [[1, "Green", 2], [1, np.nan, 1], [np.nan, np.nan, 1]]
+
+        columns = ["col1", "col2", "col3"]
+        data = pd.DataFrame(missing_data, columns=columns)
+
+        clean = Classification(x_train=data, target="col3", x_test=data)
+
+        self.assertRaises(
+            KeyError, clean.replace_missing_new_category, col_mapping={"col4": "Blue"}
+        )
+
     def test_cleancategorical_replacemissingnewcategory_list_constantnotnone(self):
 
         missing_data = np.array([(1, "Green", 2), (1, "Other", 1), (None, None, None)])
@@ -201,6 +240,55 @@ class TestCleaning(unittest.TestCase):
             validate, [[1, "Green", 2], [1, "Other", 1], [-1, "Unknown", -1]]
         )
 
+    def test_cleancategorical_replacemissingnewcategory_testdata(self):
+
+        missing_data = [[1.0, "Green", 2], [1.0, "Other", 1], [np.nan, np.nan, -1]]
+
+        columns = ["col1", "col2", "col3"]
+        data = pd.DataFrame(missing_data, columns=columns)
+
+        clean = Classification(x_train=data, target="col3", x_test=data.copy())
+        clean.replace_missing_new_category()
+        validate = clean.x_test.values.tolist()
+
+        self.assertListEqual(
+            validate, [[1, "Green", 2], [1, "Other", 1], [-1, "Unknown", -1]]
+        )
+
+    def test_cleancategorical_replacemissingnewcategory_testdatadtype(self):
+
+        columns = ["col1", "col2"]
+        train_data = pd.DataFrame([[1.0, 1], [np.nan, 0]], columns=columns)
+        test_data = pd.DataFrame([[3e10, 1], [np.nan, 0]], columns=columns)
+
+        clean = Classification(x_train=train_data, target="col2", x_test=test_data)
+        clean.replace_missing_new_category("col1")
+
+        self.assertEqual(clean.x_train["col1"].dtype, clean.x_test["col1"].dtype)
+        self.assertListEqual(clean.x_test["col1"].tolist(), [30000000000, -1])
+
+    def test_cleancategorical_replacemissingnewcategory_nodefault(self):
+
+        missing_data = [[-1.0, 1], [-999.0, 0], [-9999.0, 1], [np.nan, 0]]
+
+        columns = ["col1", "col2"]
+        data = pd.DataFrame(missing_data, columns=columns)
+
+        clean = Classification(x_train=data, target="col2", x_test=data.copy())
+
+        self.assertRaises(ValueError, clean.replace_missing_new_category, "col1")
+
+    def test_cleancategorical_replacemissingnewcategory_infinite(self):
+
+        missing_data = [[1.0, 1], [np.inf, 0], [np.nan, 1], [2.0, 0]]
+
+        columns = ["col1", "col2"]
+        data = pd.DataFrame(missing_data, columns=columns)
+
+        clean = Classification(x_train=data, target="col2", x_test=data.copy())
+
+        self.assertRaises(ValueError, clean.replace_missing_new_category, "col1")
+
     def test_cleanutil_removeduplicaterows(self):
 
         data = [[1, 0, 2], [0, 2, 1], [1, 0, 2]]
@@ -36,3 +36,30 @@ def replace_missing_fill(
             x_test[col] = x_test[col].fillna(method=method, **extra_kwargs)
 
     return x_train, x_test
+
+
+def drop_rows_missing(x, list_of_cols):
+    """
+    Drops the rows that have a missing value in any of the columns.
+
+    dropna always builds a new Dataframe, so when none of the columns have
+    missing values the Dataframe is returned as is.
+    
+    Parameters
+    ----------
+    x: Dataframe
+        Dataset
+
+    list_of_cols : list
+        A list of specific columns to check for missing values
+    
+    Returns
+    -------
+    Dataframe
+        Dataframe without the rows that have missing values in the columns
+    """
+
+    if not x[list_of_cols].isna().to_numpy().any():
+        return x
+
+    return x.dropna(axis=0, subset=list_of_cols)
@@ -507,3 +507,29 @@ def is_type_factory(_type):
 
 is_bool = is_type_factory(bool)
 is_list = is_type_factory(list)
+
+
+def is_positive_int(value):
+    """
+    Verify that value is None or a positive int.
+
+    Parameters
+    ----------
+    value : None or int
+            The `value` to be checked.
+
+    Raises
+    ------
+    ValueError
+        When the value is not None or a positive integer
+    """
+
+    if value is None:
+        return
+
+    elif isinstance(value, int) and not isinstance(value, bool):
+        if value > 0:
+            return
+
+    msg = "Value must be a positive integer or None"
+    raise ValueError(msg)
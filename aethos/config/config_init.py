@@ -1,6 +1,6 @@
 import aethos.config.config as cf
 from aethos.config import cfg, shell
-from aethos.config.config import is_bool, is_list
+from aethos.config.config import is_bool, is_list, is_positive_int
 from aethos.config.user_config import _make_experiment_dir
 from aethos.util import _make_dir
 
@@ -74,6 +74,14 @@ project_metric_doc = """
         'SMAPE': 'Symmetric mean absolute percentage error. It is an accuracy measure based on percentage (or relative) errors.
     """
 
+shap_kernel_samples_doc = """
+: int
+    Number of training samples SHAP's KernelExplainer uses as its background data.
+    Fewer samples explain models faster at the cost of accuracy.
+    Default value is None, the whole training set is used.
+    Valid values: None, positive integers
+"""
+
 track_experiments_doc = """
 : bool
     Track experminets with MLFlow
@@ -125,6 +133,13 @@ cf.register_option(
     "project_metrics", default=[], doc=project_metric_doc, validator=is_list
 )
 
+cf.register_option(
+    "shap_kernel_samples",
+    default=None,
+    doc=shap_kernel_samples_doc,
+    validator=is_positive_int,
+)
+
 cf.register_option(
     "track_experiments",
     default=False,
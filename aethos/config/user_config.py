@@ -1,7 +1,7 @@
 import os
+import sys
 
 import yaml
-from IPython import get_ipython
 
 from aethos.util import _make_dir
 
@@ -12,7 +12,24 @@ with open(
 ) as ymlfile:
     cfg = yaml.safe_load(ymlfile)
 
-shell = get_ipython().__class__.__name__
+
+def _get_shell():
+    """
+    Name of the running IPython shell class, "NoneType" outside of IPython.
+
+    IPython is always imported by the time a shell is running, so when it hasn't been
+    imported there is no shell and it is not imported just to find that out.
+    """
+
+    if "IPython" not in sys.modules:
+        return "NoneType"
+
+    from IPython import get_ipython
+
+    return get_ipython().__class__.__name__
+
+
+shell = _get_shell()
 
 
 def _make_image_dir():
@@ -6,6 +6,7 @@ import pandas as pd
 import warnings
 
 from aethos.config import IMAGE_DIR
+from aethos.config.config import _global_config
 
 warnings.simplefilter("ignore", UserWarning)
 
@@ -34,7 +35,16 @@ class Shap(object):
             else:
                 func = self.model.predict
 
-            self.explainer = shap.KernelExplainer(func, self.x_train)
+            # KernelExplainer's run time grows with the background data, so optionally
+            # explain against a sample of the training data as SHAP recommends.
+            background = self.x_train
+
+            if _global_config["shap_kernel_samples"]:
+                background = shap.sample(
+                    self.x_train, _global_config["shap_kernel_samples"]
+                )
+
+            self.explainer = shap.KernelExplainer(func, background)
         else:
             raise ValueError(f"Learner: {learner} is not supported yet.")
 
@@ -2,7 +2,8 @@ import pandas as pd
 import unittest
 import numpy as np
 
-from aethos import Classification, Regression, Unsupervised
+from aethos import Classification, Regression, Unsupervised, reset_option, set_option
+from aethos.model_analysis.model_explanation import Shap
 
 class TestModelAnalysis(unittest.TestCase):
     def test_plot_predicted_actual(self):
@@ -31,5 +32,26 @@ class TestModelAnalysis(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_shap_kernel_samples(self):
+
+        from sklearn.naive_bayes import GaussianNB
+
+        data = np.random.RandomState(42).randint(0, 2, size=(20, 3))
+
+        x_train = pd.DataFrame(data=data[:, :2], columns=["col1", "col2"])
+        x_test = x_train.iloc[:2]
+        model = GaussianNB().fit(x_train, data[:, 2])
+
+        self.addCleanup(reset_option, "shap_kernel_samples")
+
+        shap_full = Shap(model, "gnb", x_train, x_test, data[:2, 2], "kernel")
+
+        set_option("shap_kernel_samples", 5)
+        shap_sampled = Shap(model, "gnb", x_train, x_test, data[:2, 2], "kernel")
+
+        self.assertEqual(shap_full.explainer.data.data.shape[0], 20)
+        self.assertEqual(shap_sampled.explainer.data.data.shape[0], 5)
+        self.assertRaises(ValueError, set_option, "shap_kernel_samples", 0)
+
 if __name__ == "__main__":
     unittest.main()
@@ -139,7 +139,7 @@ class TextModelAnalysis(ModelAnalysisBase):
 
         return pyLDAvis.gensim.prepare(self.model, self.corpus, self.id2word, **kwargs)
 
-    def coherence_score(self, col_name):
+    def coherence_score(self, col_name, coherence="c_v"):
         """
         Displays the coherence score of the topic model.
 
@@ -150,6 +150,9 @@ class TextModelAnalysis(ModelAnalysisBase):
         col_name : str
             Column name that was used as input for the LDA model
 
+        coherence : str, optional
+            Coherence measure to use, one of 'c_v', 'u_mass', 'c_uci' or 'c_npmi', by default 'c_v'
+
         Examples
         --------
         >>> m = model.LDA()
@@ -162,7 +165,7 @@ class TextModelAnalysis(ModelAnalysisBase):
         texts = self.x_train[col_name].tolist()
 
         coherence_model_lda = gensim.models.CoherenceModel(
-            model=self.model, texts=texts, dictionary=self.id2word, coherence="c_v"
+            model=self.model, texts=texts, dictionary=self.id2word, coherence=coherence
         )
         coherence_lda = coherence_model_lda.get_coherence()
 
@@ -18,6 +18,7 @@ from aethos.model_analysis.text_model_analysis import TextModelAnalysis
 from aethos.modelling import text
 from aethos.modelling.util import (
     _get_cv_type,
+    _load_pipeline,
     _make_img_project_dir,
     _run_models_parallel,
     add_to_queue,
@@ -1031,14 +1032,7 @@ class ModelBase(object):
         """
         # endregion
 
-        try:
-            from transformers import pipeline
-        except ModuleNotFoundError as e:
-            raise EnvironmentError(
-                "Pre trained model dependencies have not been installed. Please run pip install aethos[ptmodels]"
-            )
-
-        nlp = pipeline("sentiment-analysis", model=model_type)
+        nlp = _load_pipeline("sentiment-analysis", model_type)
 
         self.x_train[new_col_name] = pd.Series(map(nlp, self.x_train[col].tolist()))
 
@@ -1157,14 +1151,7 @@ class ModelBase(object):
         """
         # endregion
 
-        try:
-            from transformers import pipeline
-        except ModuleNotFoundError as e:
-            raise EnvironmentError(
-                "Pre trained model dependencies have not been installed. Please run pip install aethos[ptmodels]"
-            )
-
-        nlp = pipeline("question-answering", model=model_type)
+        nlp = _load_pipeline("question-answering", model_type)
         q_and_a = lambda c, q: nlp({"question": q, "context": c})
 
         self.x_train[new_col_name] = pd.Series(
@@ -1,38 +1,214 @@
 import os
 import shutil
+import tempfile
 import unittest
-from pathlib import Path
+from functools import lru_cache
+from multiprocessing.pool import ThreadPool
+from unittest import mock
 
 import numpy as np
 import pandas as pd
+import sklearn
 from sklearn.datasets import make_blobs
+from sklearn.model_selection import train_test_split
+
+from aethos import (
+    Classification,
+    Regression,
+    Unsupervised,
+    Analysis,
+    reset_option,
+    set_option,
+)
+from aethos.config import cfg
+from aethos.templates.template_generator import TemplateGenerator
+
+# SHAP and interpret explainers are slow and mostly exercise third party code, so
+# those tests, and the real multiprocessing path of run_models, only run when
+# AETHOS_FULL_TESTS=1, e.g. in the nightly CI build.
+FULL_TESTS = os.environ.get("AETHOS_FULL_TESTS") == "1"
+skip_shap = unittest.skipUnless(FULL_TESTS, "Set AETHOS_FULL_TESTS=1 to run.")
+
+# Built once with a fixed seed and handed out as a shallow copy to each test.
+_RNG = np.random.default_rng(0)
+_BINARY_500x3 = pd.DataFrame(
+    _RNG.integers(0, 2, size=(500, 3)), columns=["col1", "col2", "col3"]
+)
+_FLOAT_500x3 = pd.DataFrame(_RNG.random((500, 3)), columns=["col1", "col2", "col3"])
+_CLUSTERS_6x2 = pd.DataFrame(
+    [[1, 2], [2, 2], [2, 3], [8, 7], [8, 8], [25, 80]], columns=["col1", "col2"]
+)
+
+
+def _split(data, test_size, stratify=None):
+
+    return [
+        split.reset_index(drop=True)
+        for split in train_test_split(
+            data, test_size=test_size, stratify=stratify, random_state=0
+        )
+    ]
+
+
+# Train/test splits of the binary data, split once per test size so the model
+# constructors don't reshuffle it each test. Like split_data, only the
+# classification splits are stratified on the target.
+_BINARY_SPLITS = {
+    test_size: _split(_BINARY_500x3, test_size, stratify=_BINARY_500x3["col3"])
+    for test_size in (0.2, 0.4, 0.5, 0.6)
+}
+_REGRESSION_SPLITS = {
+    test_size: _split(_BINARY_500x3, test_size) for test_size in (0.2, 0.5)
+}
+
+
+def _binary_split(test_size=0.2):
+
+    x_train, x_test = _BINARY_SPLITS[test_size]
+
+    return x_train.copy(deep=False), x_test.copy(deep=False)
+
+
+def _regression_split(test_size=0.2):
+
+    x_train, x_test = _REGRESSION_SPLITS[test_size]
+
+    return x_train.copy(deep=False), x_test.copy(deep=False)
+
+
+# Corpus shared by the text tests, tokenized once for the tests that take prepped text.
+_TEXT_DATA = [
+    "Hi my name is aethos. Please split me.",
+    "This function is going to split by sentence. Automation is great.",
+]
+_TOKENS = [text.split() for text in _TEXT_DATA]
+
+# The gensim tests only check the plumbing, so train tiny single threaded models
+# for one pass instead of paying for gensim's worker pool and default epochs.
+_W2V_KWARGS = {"min_count": 1, "workers": 1, "sg": 0, "size": 8, "iter": 1}
+_D2V_KWARGS = {"min_count": 1, "workers": 1, "vector_size": 8, "epochs": 1}
+_LDA_KWARGS = {
+    "num_topics": 2,
+    "passes": 1,
+    "iterations": 5,
+    "chunksize": 2,
+    "eval_every": None,
+}
 
-from aethos import Classification, Regression, Unsupervised, Analysis
+# The ensemble tests only check the fit and analysis plumbing, a couple of shallow
+# trees exercise it as well as the default hundred.
+_ENSEMBLE_KWARGS = {"random_state": 2, "n_estimators": 2}
+_TREE_KWARGS = {**_ENSEMBLE_KWARGS, "max_depth": 2}
+
+# pytest-xdist already runs a worker per core, keep the estimators that can
+# multithread to a single thread so they don't oversubscribe them.
+_SERIAL_TREE_KWARGS = {**_TREE_KWARGS, "n_jobs": 1}
+_LGBM_KWARGS = {**_ENSEMBLE_KWARGS, "num_leaves": 2, "n_jobs": 1}
+
+# liblinear converges in a single pass on the small binary datasets used here.
+_LOG_REG_KWARGS = {"solver": "liblinear", "max_iter": 50}
+
+
+# Tests that only exercise a fitted model's analysis api share one LogisticRegression
+# per test split. Each is fitted the first time a test asks for it, so the splits only
+# skipped tests use never pay for the fit and its SHAP and interpret explainers.
+@lru_cache(maxsize=None)
+def _log_reg(test_split_percentage):
+
+    x_train, x_test = _binary_split(test_split_percentage)
+
+    model = Classification(x_train=x_train, target="col3", x_test=x_test)
+    model.LogisticRegression(random_state=2, penalty="l2", run=True, **_LOG_REG_KWARGS)
+
+    return model.log_reg
 
 
 class TestModelling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+
+        # Each test process writes models and projects to its own temp directory
+        # so pytest-xdist workers running in parallel can't collide.
+        cls._tmp = tempfile.mkdtemp(prefix="aethos-test-")
+
+        cls.models_path = os.path.join(cls._tmp, "models")
+        cls.projects_path = os.path.join(cls._tmp, "projects")
+
+        cls._patches = [
+            mock.patch.dict(cfg["models"], {"dir": cls.models_path}),
+            mock.patch.object(TemplateGenerator, "project_dir", cls.projects_path),
+        ]
+
+        # The modelling tests control their inputs, so skip sklearn's NaN/inf scan of X
+        # on every fit and, where this sklearn has it (>= 1.3), its per call parameter
+        # validation. The other suites feed NaN and inf on purpose and keep the checks.
+        sklearn_config = {"assume_finite": True}
+
+        if "skip_parameter_validation" in sklearn.get_config():
+            sklearn_config["skip_parameter_validation"] = True
+
+        cls._sklearn_config = sklearn.config_context(**sklearn_config)
+        cls._sklearn_config.__enter__()
+
+        for patch in cls._patches:
+            patch.start()
+
+        # The kernel SHAP learners (SVC, naive Bayes, bagging, AdaBoost) explain every
+        # fit, a small background sample keeps that fast.
+        set_option("shap_kernel_samples", 10)
+
+        # Unfitted wrappers for tests that train a model and only look at that
+        # model, so they can share the train/test split instead of redoing it.
+        cls.classification_models = {}
+
+        for split in (0.2, 0.5):
+            x_train, x_test = _binary_split(split)
+            cls.classification_models[split] = Classification(
+                x_train=x_train, target="col3", x_test=x_test
+            )
+
+        x_train, x_test = _regression_split()
+        cls.regression_model = Regression(x_train=x_train, target="col3", x_test=x_test)
+
+        # The gensim ops only add columns and models to the wrapper, so the text
+        # tests can all run against one. Tests that inspect the queue make their own.
+        cls.text_model = Unsupervised(
+            x_train=pd.DataFrame({"data": _TEXT_DATA, "prep": _TOKENS})
+        )
+
     @classmethod
     def tearDownClass(cls):
 
-        models_path = str(Path.home()) + "/.aethos/models/"
-        projects_path = str(Path.home()) + "/.aethos/projects/"
+        for patch in cls._patches:
+            patch.stop()
 
-        if os.path.exists(models_path):
-            shutil.rmtree(models_path)
+        reset_option("shap_kernel_samples")
+        cls._sklearn_config.__exit__(None, None, None)
 
-        if os.path.exists(projects_path):
-            shutil.rmtree(projects_path)
+        shutil.rmtree(cls._tmp, ignore_errors=True)
 
-    def test_text_gensim_summarize(self):
+    def _use_tmp_dirs(self):
+        """
+        Points the model and project directories at a temp directory of this test's
+        own, so tests that check what was written can't see another test's files.
+        """
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
+        tmp = tempfile.mkdtemp(prefix="aethos-test-", dir=self._tmp)
+        models_path = os.path.join(tmp, "models")
+        projects_path = os.path.join(tmp, "projects")
 
-        data = pd.DataFrame(data=text_data, columns=["data"])
+        for patch in (
+            mock.patch.dict(cfg["models"], {"dir": models_path}),
+            mock.patch.object(TemplateGenerator, "project_dir", projects_path),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
 
-        model = Unsupervised(x_train=data)
+        return models_path, projects_path
+
+    def test_text_gensim_summarize(self):
+
+        model = self.text_model
         model.summarize_gensim("data", ratio=0.5, run=True)
         validate = model["data_summarized"] is not None
 
@@ -40,14 +216,7 @@ class TestModelling(unittest.TestCase):
 
     def test_text_view_gensim_summarize(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-
-        model = Unsupervised(x_train=data)
+        model = self.text_model
         m = model.summarize_gensim("data", ratio=0.5, run=True)
         m.view("data", "data_summarized")
 
@@ -55,14 +224,7 @@ class TestModelling(unittest.TestCase):
 
     def test_text_gensim_keywords(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-
-        model = Unsupervised(x_train=data)
+        model = self.text_model
         model.extract_keywords_gensim("data", ratio=0.5, run=True)
         validate = model.data_extracted_keywords is not None
 
@@ -70,62 +232,32 @@ class TestModelling(unittest.TestCase):
 
     def test_text_gensim_w2v(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-
-        model = Unsupervised(x_train=data)
-        model.Word2Vec("data", prep=True, run=True, min_count=1)
+        model = self.text_model
+        model.Word2Vec("data", prep=True, run=True, **_W2V_KWARGS)
         validate = model.w2v is not None
 
         self.assertTrue(validate)
 
     def test_text_gensim_lda(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-        data["prep"] = pd.Series([text.split() for text in text_data])
-
-        model = Unsupervised(x_train=data)
-        model.LDA("prep")
+        model = self.text_model
+        model.LDA("prep", **_LDA_KWARGS)
         validate = model.lda is not None
 
         self.assertTrue(validate)
 
     def test_text_gensim_prep_lda(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-
-        model = Unsupervised(x_train=data)
-        model.LDA("data", prep=True)
+        model = self.text_model
+        model.LDA("data", prep=True, **_LDA_KWARGS)
         validate = model.lda is not None
 
         self.assertTrue(validate)
 
     def test_text_view_topics(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-        data["prep"] = pd.Series([text.split() for text in text_data])
-
-        model = Unsupervised(x_train=data)
-        l = model.LDA("prep")
+        model = self.text_model
+        l = model.LDA("prep", **_LDA_KWARGS)
         l.view_topics()
         l.view_topic(1)
 
@@ -133,93 +265,47 @@ class TestModelling(unittest.TestCase):
 
     def test_text_model_perplexity(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-        data["prep"] = pd.Series([text.split() for text in text_data])
-
-        model = Unsupervised(x_train=data)
-        l = model.LDA("prep")
+        model = self.text_model
+        l = model.LDA("prep", **_LDA_KWARGS)
         l.model_perplexity()
 
         self.assertTrue(True)
 
     def test_text_coherence_score(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-        data["prep"] = pd.Series([text.split() for text in text_data])
-
-        model = Unsupervised(x_train=data)
-        l = model.LDA("prep")
-        l.coherence_score("prep")
+        model = self.text_model
+        l = model.LDA("prep", **_LDA_KWARGS)
+        l.coherence_score("prep", coherence="u_mass")
 
         self.assertTrue(True)
 
     def test_text_w2vprep(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-        data["prep"] = pd.Series([text.split() for text in text_data])
-
-        model = Unsupervised(x_train=data)
-        model.Word2Vec("prep", run=True, min_count=1)
+        model = self.text_model
+        model.Word2Vec("prep", run=True, **_W2V_KWARGS)
         validate = model.w2v is not None
 
         self.assertTrue(validate)
 
     def test_text_d2v(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-
-        model = Unsupervised(x_train=data)
-        model.Doc2Vec("data", prep=True, run=True, min_count=1)
+        model = self.text_model
+        model.Doc2Vec("data", prep=True, run=True, **_D2V_KWARGS)
         validate = model.d2v is not None
 
         self.assertTrue(validate)
 
     def test_text_d2vprep(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-        data["prep"] = pd.Series([text.split() for text in text_data])
-
-        model = Unsupervised(x_train=data)
-        model.Doc2Vec("prep", run=True, min_count=1)
+        model = self.text_model
+        model.Doc2Vec("prep", run=True, **_D2V_KWARGS)
         validate = model.d2v is not None
 
         self.assertTrue(validate)
 
     def test_model_getattr(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
-
-        model = Unsupervised(x_train=data)
+        model = self.text_model
         model.extract_keywords_gensim("data", ratio=0.5, model_name="model1", run=True)
         validate = model.model1 is not None
 
@@ -227,12 +313,7 @@ class TestModelling(unittest.TestCase):
 
     def test_model_addtoqueue(self):
 
-        text_data = [
-            "Hi my name is aethos. Please split me.",
-            "This function is going to split by sentence. Automation is great.",
-        ]
-
-        data = pd.DataFrame(data=text_data, columns=["data"])
+        data = pd.DataFrame({"data": _TEXT_DATA})
 
         model = Unsupervised(x_train=data)
         model.extract_keywords_gensim("data", ratio=0.5, model_name="model1", run=False)
@@ -243,31 +324,38 @@ class TestModelling(unittest.TestCase):
 
     def test_model_kmeans(self):
 
-        data, _ = make_blobs(n_samples=1000, n_features=12, centers=8, random_state=42)
-        data = pd.DataFrame(data=data)
+        # float32 blobs use sklearn's single precision KMeans path at half the memory.
+        data, _ = make_blobs(n_samples=200, n_features=4, centers=3, random_state=42)
+        data = pd.DataFrame(data=data.astype(np.float32, copy=False))
 
         model = Unsupervised(x_train=data,)
-        model.KMeans(n_clusters=3, random_state=0, run=True)
+        model.KMeans(
+            n_clusters=3,
+            n_init=1,
+            max_iter=10,
+            algorithm="elkan",
+            random_state=0,
+            run=True,
+        )
         validate = model.km is not None
 
         self.assertTrue(validate)
 
     def test_model_kmeans_nok(self):
 
-        data, _ = make_blobs(n_samples=1000, n_features=12, centers=8, random_state=42)
-        data = pd.DataFrame(data=data)
+        # The elbow search only tries k in [4, 12), so keep the centers in that range.
+        data, _ = make_blobs(n_samples=200, n_features=4, centers=8, random_state=42)
+        data = pd.DataFrame(data=data.astype(np.float32, copy=False))
 
         model = Unsupervised(x_train=data,)
-        model.KMeans(random_state=0, run=True)
+        model.KMeans(n_init=1, max_iter=10, algorithm="elkan", random_state=0, run=True)
         validate = model.km is not None
 
         self.assertTrue(validate)
 
     def test_model_dbscan(self):
 
-        data = [[1, 2], [2, 2], [2, 3], [8, 7], [8, 8], [25, 80]]
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2"])
+        data = _CLUSTERS_6x2.copy(deep=False)
 
         model = Unsupervised(x_train=data,)
         model.DBScan(eps=3, min_samples=2, run=True)
@@ -277,9 +365,7 @@ class TestModelling(unittest.TestCase):
 
     def test_model_cluster_filter(self):
 
-        data = [[1, 2], [2, 2], [2, 3], [8, 7], [8, 8], [25, 80]]
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2"])
+        data = _CLUSTERS_6x2.copy(deep=False)
 
         model = Unsupervised(x_train=data,)
         model = model.DBScan(eps=3, min_samples=2, run=True)
@@ -308,203 +394,117 @@ class TestModelling(unittest.TestCase):
 
         gridsearch_params = {"C": [0.2, 1]}
         model.LogisticRegression(
-            gridsearch=gridsearch_params, cv_type="kfold", run=True
+            gridsearch=gridsearch_params, cv_type="kfold", run=True, **_LOG_REG_KWARGS
         )
 
         self.assertTrue(True)
 
     def test_model_logisticregression(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
+        model = self.classification_models[0.2]
+        model.LogisticRegression(
+            random_state=2, penalty="l2", run=True, **_LOG_REG_KWARGS
+        )
         validate = model.log_reg.y_pred is not None
 
         self.assertTrue(validate)
 
     def test_model_confusionmatrix(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3",)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.confusion_matrix()
+        _log_reg(0.2).confusion_matrix()
 
         self.assertTrue(True)
 
     def test_model_all_score_metrics(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3",)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.metrics()
+        _log_reg(0.2).metrics()
 
         self.assertTrue(True)
 
     def test_model_report_classificationreport(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3",)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.classification_report()
+        _log_reg(0.2).classification_report()
 
         self.assertTrue(True)
 
     def test_model_report_modelweights(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3",)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.model_weights()
+        _log_reg(0.2).model_weights()
 
         self.assertTrue(True)
 
     def test_plot_roccurve(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.roc_curve()
+        _log_reg(0.5).roc_curve()
 
         self.assertTrue(True)
 
+    @skip_shap
     def test_decision_plot(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.decision_plot()
-
-        self.assertTrue(True)
-
-    def test_decision_plot_all(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        log_reg = _log_reg(0.5)
 
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.decision_plot(num_samples="all")
+        for kwargs in [
+            {},
+            {"num_samples": "all"},
+            {"num_samples": 0.75, "highlight_misclassified": True},
+        ]:
+            with self.subTest(**kwargs):
+                log_reg.decision_plot(**kwargs)
 
         self.assertTrue(True)
 
+    @skip_shap
     def test_decision_plot_sameaxis(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        r = model.log_reg.decision_plot(sample_no=1)
-        model.log_reg.decision_plot(
-            sample_no=2, feature_order=r.feature_idx, xlim=r.xlim
-        )
-
-        self.assertTrue(True)
-
-    def test_decision_plot_misclassified(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.decision_plot(0.75, highlight_misclassified=True)
+        log_reg = _log_reg(0.5)
+        r = log_reg.decision_plot(sample_no=1)
+        log_reg.decision_plot(sample_no=2, feature_order=r.feature_idx, xlim=r.xlim)
 
         self.assertTrue(True)
 
+    @skip_shap
     def test_force_plot(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.force_plot()
+        _log_reg(0.5).force_plot()
 
         self.assertTrue(True)
 
+    @skip_shap
     def test_force_plot_misclassified(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.6)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.force_plot(misclassified=True)
+        _log_reg(0.6).force_plot(misclassified=True)
 
         self.assertTrue(True)
 
+    @skip_shap
     def test_get_misclassified(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.shap_get_misclassified_index()
+        _log_reg(0.5).shap_get_misclassified_index()
 
         self.assertTrue(True)
 
+    @skip_shap
     def test_summaryplot(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.summary_plot()
+        _log_reg(0.5).summary_plot()
 
         self.assertTrue(True)
 
+    @skip_shap
     def test_dependence_plot(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5)
-        model.LogisticRegression(random_state=2, penalty="l2", run=True)
-        model.log_reg.dependence_plot("col1")
+        _log_reg(0.5).dependence_plot("col1")
 
         self.assertTrue(True)
 
     def test_local_multiprocessing(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        x_train, x_test = _binary_split(0.5)
 
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l1", run=False
+            random_state=2, penalty="l2", model_name="l1", run=False, **_LOG_REG_KWARGS
         )
         model.LogisticRegression(
             gridsearch={"C": [0.1, 0.2]},
@@ -512,149 +512,88 @@ class TestModelling(unittest.TestCase):
             penalty="l2",
             model_name="l2",
             run=False,
+            **_LOG_REG_KWARGS,
         )
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l3", run=False
+            random_state=2, penalty="l2", model_name="l3", run=False, **_LOG_REG_KWARGS
         )
 
-        model.run_models()
+        if FULL_TESTS:
+            model.run_models()
+        else:
+            # Spawning processes and pickling the data costs far more than fitting
+            # these models, so run the pool on threads unless doing a full run.
+            with mock.patch("multiprocessing.Pool", ThreadPool):
+                model.run_models()
 
         self.assertTrue(len(model._models) == 3 and len(model._queued_models) == 0)
 
     def test_local_seriesprocessing(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
+        x_train, x_test = _binary_split(0.5)
 
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l1", run=True
+            random_state=2, penalty="l2", model_name="l1", run=True, **_LOG_REG_KWARGS
         )
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l2", run=True
+            random_state=2, penalty="l2", model_name="l2", run=True, **_LOG_REG_KWARGS
         )
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l3", run=True
+            random_state=2, penalty="l2", model_name="l3", run=True, **_LOG_REG_KWARGS
         )
 
         model.run_models(method="series")
 
         self.assertTrue(len(model._models) == 3 and len(model._queued_models) == 0)
 
-    def test_interpretmodel_behaviour_all(self):
-
-        train_data = np.random.random_sample(size=(1000, 2))
-        label_data = np.random.randint(0, 2, size=(1000, 1))
-
-        data = pd.DataFrame(data=train_data, columns=["col1", "col2"])
-        data["col3"] = label_data
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.2)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.interpret_model_behavior(show=False)
-
-        self.assertTrue(True)
-
-    def test_interpretmodel_behaviour_dependence(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.4)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.interpret_model_behavior(method="dependence", show=False)
-
-        self.assertTrue(True)
-
-    def test_interpretmodel_predictions_all(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.6)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.interpret_model_predictions(show=False)
-
-        self.assertTrue(True)
-
-    def test_interpretmodel_predictions_lime(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.6)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.interpret_model_predictions(method="lime", show=False)
-
-        self.assertTrue(True)
-
-    def test_interpretmodel_performance_all(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.6)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.interpret_model_performance(show=False)
-
-        self.assertTrue(True)
+    @skip_shap
+    def test_interpretmodel(self):
 
-    def test_interpretmodel_performance_roc(self):
+        log_reg = _log_reg(0.6)
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.6)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.interpret_model_performance(method="ROC", show=False)
+        for api, kwargs in [
+            ("interpret_model_behavior", {}),
+            ("interpret_model_behavior", {"method": "dependence"}),
+            ("interpret_model_predictions", {}),
+            ("interpret_model_predictions", {"method": "lime"}),
+            ("interpret_model_performance", {}),
+            ("interpret_model_performance", {"method": "ROC"}),
+        ]:
+            with self.subTest(api=api, **kwargs):
+                getattr(log_reg, api)(show=False, **kwargs)
 
         self.assertTrue(True)
 
+    @skip_shap
     def test_interpret_model(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.4)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.interpret_model(show=False)
+        _log_reg(0.4).interpret_model(show=False)
 
         self.assertTrue(True)
 
+    @skip_shap
     def test_interpret_model_prerun(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.4)
-        model.LogisticRegression(random_state=2, run=True)
-        model.log_reg.interpret_model_performance(method="ROC", show=False)
-        model.log_reg.interpret_model(show=False)
+        log_reg = _log_reg(0.4)
+        log_reg.interpret_model_performance(method="ROC", show=False)
+        log_reg.interpret_model(show=False)
 
         self.assertTrue(True)
 
     def test_compareclsmodels(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        x_train, x_test = _binary_split(0.5)
 
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l1", run=True
+            random_state=2, penalty="l2", model_name="l1", run=True, **_LOG_REG_KWARGS
         )
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l2", run=True
+            random_state=2, penalty="l2", model_name="l2", run=True, **_LOG_REG_KWARGS
         )
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l3", run=True
+            random_state=2, penalty="l2", model_name="l3", run=True, **_LOG_REG_KWARGS
         )
 
         model.run_models(method="series")
@@ -664,11 +603,9 @@ class TestModelling(unittest.TestCase):
 
     def test_compareregmodels(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
+        x_train, x_test = _regression_split(0.5)
 
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3", test_split_percentage=0.5,)
+        model = Regression(x_train=x_train, target="col3", x_test=x_test)
         model.LinearRegression(model_name="l1", run=True)
         model.LinearRegression(model_name="l2", run=True)
         model.LinearRegression(model_name="l3", run=True)
@@ -680,10 +617,8 @@ class TestModelling(unittest.TestCase):
 
     def test_cv(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-        model = Regression(x_train=data, target="col3", test_split_percentage=0.2)
+        x_train, x_test = _regression_split(0.2)
+        model = Regression(x_train=x_train, target="col3", x_test=x_test)
         m = model.LinearRegression()
         m.cross_validate()
 
@@ -691,91 +626,48 @@ class TestModelling(unittest.TestCase):
 
     def test_stratified_cv(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.2)
-        cv_values = model.LogisticRegression(run=True)
+        model = self.classification_models[0.2]
+        cv_values = model.LogisticRegression(run=True, **_LOG_REG_KWARGS)
         cv_values.cross_validate(cv_type="strat-kfold", n_splits=10)
 
         self.assertTrue(True)
 
     def test_del_model(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.2)
-        model.LogisticRegression(random_state=2, run=True)
+        x_train, x_test = _binary_split(0.2)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
+        model.LogisticRegression(random_state=2, run=True, **_LOG_REG_KWARGS)
         model.delete_model("log_reg")
 
         self.assertTrue(len(model._models) == 0)
 
-    def test_model_ridgeclassifier(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.RidgeClassification(random_state=2, run=True)
-        validate = model.ridge_cls is not None
-
-        self.assertTrue(validate)
-
-    def test_model_sgdclassifier(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.SGDClassification(random_state=2, run=True)
-        validate = model.sgd_cls is not None
-
-        self.assertTrue(validate)
-
-    def test_model_adaclassifier(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.ADABoostClassification(random_state=2, run=True)
-        validate = model.ada_cls is not None
-
-        self.assertTrue(validate)
-
-    def test_model_bagclassifier(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.BaggingClassification(random_state=2, run=True)
-        validate = model.bag_cls is not None
-
-        self.assertTrue(validate)
-
-    def test_model_boostingclassifier(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.GradientBoostingClassification(random_state=2, run=True)
-        validate = model.grad_cls is not None
-
-        self.assertTrue(validate)
+    def test_model_classifiers(self):
+
+        model = self.classification_models[0.2]
+
+        for method, attr, kwargs in [
+            ("RidgeClassification", "ridge_cls", {"random_state": 2}),
+            ("SGDClassification", "sgd_cls", {"random_state": 2}),
+            ("ADABoostClassification", "ada_cls", _ENSEMBLE_KWARGS),
+            ("BaggingClassification", "bag_cls", _ENSEMBLE_KWARGS),
+            ("GradientBoostingClassification", "grad_cls", _TREE_KWARGS),
+            ("RandomForestClassification", "rf_cls", _SERIAL_TREE_KWARGS),
+            ("BernoulliClassification", "bern", {}),
+            ("GaussianClassification", "gauss", {}),
+            ("MultinomialClassification", "multi", {}),
+            ("DecisionTreeClassification", "dt_cls", {"random_state": 2}),
+            ("LinearSVC", "linsvc", {"random_state": 2}),
+            ("SVC", "svc_cls", {"random_state": 2}),
+        ]:
+            with self.subTest(method=method):
+                getattr(model, method)(run=True, **kwargs)
+                validate = getattr(model, attr) is not None
+
+                self.assertTrue(validate)
 
     def test_model_isoforest(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        data = _BINARY_500x3.copy(deep=False)
 
         model = Unsupervised(x_train=data)
         model.IsolationForest(random_state=2, run=True)
@@ -785,9 +677,7 @@ class TestModelling(unittest.TestCase):
 
     def test_model_oneclasssvm(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        data = _BINARY_500x3.copy(deep=False)
 
         model = Unsupervised(x_train=data)
         model.OneClassSVM(run=True)
@@ -795,242 +685,45 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(validate)
 
-    def test_model_rfclassifier(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.RandomForestClassification(random_state=2, run=True)
-        validate = model.rf_cls is not None
-
-        self.assertTrue(validate)
-
     def test_model_view_rfclassifier(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
+        x_train, x_test = _binary_split()
 
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.RandomForestClassification(random_state=2, run=True)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
+        model.RandomForestClassification(run=True, **_SERIAL_TREE_KWARGS)
         validate = model.rf_cls.view_tree()
 
         self.assertTrue(True)
 
-    def test_model_bernoulli(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.BernoulliClassification(run=True)
-        validate = model.bern is not None
-
-        self.assertTrue(validate)
-
-    def test_model_gaussian(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.GaussianClassification(run=True)
-        validate = model.gauss is not None
-
-        self.assertTrue(validate)
-
-    def test_model_multinomial(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.MultinomialClassification(run=True)
-
-        validate = model.multi is not None
-
-        self.assertTrue(validate)
-
-    def test_model_dtclassifier(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.DecisionTreeClassification(random_state=2, run=True)
-        validate = model.dt_cls is not None
-
-        self.assertTrue(validate)
-
-    def test_model_linearsvc(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.LinearSVC(random_state=2, run=True)
-        validate = model.linsvc is not None
-
-        self.assertTrue(validate)
-
-    def test_model_svc(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.SVC(random_state=2, run=True)
-        validate = model.svc_cls is not None
-
-        self.assertTrue(validate)
-
-    def test_model_bayesianridge(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.BayesianRidgeRegression(run=True)
-        validate = model.bayridge_reg is not None
-
-        self.assertTrue(validate)
-
-    def test_model_elasticnet(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.ElasticnetRegression(random_state=2, run=True)
-        validate = model.elastic is not None
-
-        self.assertTrue(validate)
-
-    def test_model_lasso(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.LassoRegression(random_state=2, run=True)
-        validate = model.lasso is not None
-
-        self.assertTrue(validate)
-
-    def test_model_linreg(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.LinearRegression()
-        validate = model.lin_reg is not None
-
-        self.assertTrue(validate)
-
-    def test_model_ridgeregression(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.RidgeRegression(random_state=2, run=True)
-        validate = model.ridge_reg is not None
-
-        self.assertTrue(validate)
-
-    def test_model_sgdregression(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.SGDRegression(random_state=2, run=True)
-        validate = model.sgd_reg is not None
-
-        self.assertTrue(validate)
-
-    def test_model_adaregression(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.ADABoostRegression(random_state=2, run=True)
-        validate = model.ada_reg is not None
-
-        self.assertTrue(validate)
-
-    def test_model_bgregression(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.BaggingRegression(random_state=2, run=True)
-        validate = model.bag_reg is not None
-
-        self.assertTrue(validate)
-
-    def test_model_gbregression(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.GradientBoostingRegression(random_state=2, run=True)
-        validate = model.grad_reg is not None
-
-        self.assertTrue(validate)
-
-    def test_model_rfregression(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.RandomForestRegression(random_state=2, run=True)
-        validate = model.rf_reg is not None
-
-        self.assertTrue(validate)
-
-    def test_model_dtregression(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.DecisionTreeRegression(random_state=2, run=True)
-        validate = model.dt_reg is not None
-
-        self.assertTrue(validate)
+    def test_model_regressors(self):
+
+        model = self.regression_model
+
+        for method, attr, kwargs in [
+            ("BayesianRidgeRegression", "bayridge_reg", {}),
+            ("ElasticnetRegression", "elastic", {"random_state": 2}),
+            ("LassoRegression", "lasso", {"random_state": 2}),
+            ("LinearRegression", "lin_reg", {}),
+            ("RidgeRegression", "ridge_reg", {"random_state": 2}),
+            ("SGDRegression", "sgd_reg", {"random_state": 2}),
+            ("ADABoostRegression", "ada_reg", _ENSEMBLE_KWARGS),
+            ("BaggingRegression", "bag_reg", _ENSEMBLE_KWARGS),
+            ("GradientBoostingRegression", "grad_reg", _TREE_KWARGS),
+            ("RandomForestRegression", "rf_reg", _SERIAL_TREE_KWARGS),
+            ("DecisionTreeRegression", "dt_reg", {"random_state": 2}),
+            ("SVR", "svr_reg", {}),
+        ]:
+            with self.subTest(method=method):
+                getattr(model, method)(run=True, **kwargs)
+                validate = getattr(model, attr) is not None
+
+                self.assertTrue(validate)
 
     def test_model_view_dtregression(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
+        x_train, x_test = _regression_split()
 
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
+        model = Regression(x_train=x_train, target="col3", x_test=x_test)
         model.DecisionTreeRegression(random_state=2, run=True)
         validate = model.dt_reg.view_tree()
 
@@ -1038,9 +731,7 @@ class TestModelling(unittest.TestCase):
 
     def test_model_linearsvr(self):
 
-        data = np.random.rand(500, 3)
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        data = _FLOAT_500x3.copy(deep=False)
 
         model = Regression(x_train=data, target="col3")
         model.LinearSVR(random_state=2, run=True)
@@ -1050,47 +741,29 @@ class TestModelling(unittest.TestCase):
 
     def test_model_view_linearsvr(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        x_train, x_test = _regression_split()
 
-        model = Regression(x_train=data, target="col3")
+        model = Regression(x_train=x_train, target="col3", x_test=x_test)
         model.LinearSVR(random_state=2, run=True)
 
         self.assertRaises(NotImplementedError, model.linsvr.view_tree)
 
-    def test_model_svr(self):
-
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.SVR(run=True)
-        validate = model.svr_reg is not None
-
-        self.assertTrue(validate)
-
     def test_model_xgbc(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        x_train, x_test = _binary_split()
 
-        model = Classification(x_train=data, target="col3")
-        model.XGBoostClassification(run=True)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
+        model.XGBoostClassification(run=True, **_SERIAL_TREE_KWARGS)
         validate = model.xgb_cls is not None
 
         self.assertTrue(validate)
 
     def test_model_view_xgbc(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        x_train, x_test = _binary_split()
 
-        model = Classification(x_train=data, target="col3")
-        model.XGBoostClassification(run=True)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
+        model.XGBoostClassification(run=True, **_SERIAL_TREE_KWARGS)
         validate = model.xgb_cls.view_tree()
 
         self.assertTrue(True)
@@ -1109,52 +782,44 @@ class TestModelling(unittest.TestCase):
         data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
 
         model = Regression(x_train=data, target="col3")
-        model.XGBoostRegression(run=True)
+        model.XGBoostRegression(run=True, **_SERIAL_TREE_KWARGS)
         validate = model.xgb_reg is not None
 
         self.assertTrue(validate)
 
     def test_model_lgbc(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
+        x_train, x_test = _binary_split()
 
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.LightGBMClassification(run=True)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
+        model.LightGBMClassification(run=True, **_LGBM_KWARGS)
         validate = model.lgbm_cls is not None
 
         self.assertTrue(validate)
 
     def test_model_lgbr(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        x_train, x_test = _regression_split()
 
-        model = Regression(x_train=data, target="col3")
-        model.LightGBMRegression(run=True)
+        model = Regression(x_train=x_train, target="col3", x_test=x_test)
+        model.LightGBMRegression(run=True, **_LGBM_KWARGS)
         validate = model.lgbm_reg is not None
 
         self.assertTrue(True)
 
     def test_model_view_lgbr(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        x_train, x_test = _regression_split()
 
-        model = Regression(x_train=data, target="col3")
-        model.LightGBMRegression(run=True)
+        model = Regression(x_train=x_train, target="col3", x_test=x_test)
+        model.LightGBMRegression(run=True, **_LGBM_KWARGS)
         model.lgbm_reg.view_tree()
 
         self.assertTrue(True)
 
     def test_model_agglom(self):
 
-        data = [[1, 2], [2, 2], [2, 3], [8, 7], [8, 8], [25, 80]]
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2"])
+        data = _CLUSTERS_6x2.copy(deep=False)
 
         model = Unsupervised(x_train=data,)
         model.AgglomerativeClustering(n_clusters=2, run=True)
@@ -1164,9 +829,7 @@ class TestModelling(unittest.TestCase):
 
     def test_model_meanshift(self):
 
-        data = [[1, 2], [2, 2], [2, 3], [8, 7], [8, 8], [25, 80]]
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2"])
+        data = _CLUSTERS_6x2.copy(deep=False)
 
         model = Unsupervised(x_train=data,)
         model.MeanShift(run=True)
@@ -1176,9 +839,7 @@ class TestModelling(unittest.TestCase):
 
     def test_model_gaussianmixture(self):
 
-        data = [[1, 2], [2, 2], [2, 3], [8, 7], [8, 8], [25, 80]]
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2"])
+        data = _CLUSTERS_6x2.copy(deep=False)
 
         model = Unsupervised(x_train=data,)
         model.GaussianMixtureClustering(run=True)
@@ -1188,9 +849,7 @@ class TestModelling(unittest.TestCase):
 
     def test_plot_clusters2d(self):
 
-        data = [[1, 2], [2, 2], [2, 3], [8, 7], [8, 8], [25, 80]]
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2"])
+        data = _CLUSTERS_6x2.copy(deep=False)
 
         model = Unsupervised(x_train=data,)
         model.KMeans(n_clusters=3, random_state=0, run=True)
@@ -1260,67 +919,65 @@ class TestModelling(unittest.TestCase):
 
     def test_pickle_model(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        models_path, _ = self._use_tmp_dirs()
+        x_train, x_test = _regression_split()
 
-        model = Regression(x_train=data, target="col3")
-        model.ADABoostRegression(random_state=2, run=True)
+        model = Regression(x_train=x_train, target="col3", x_test=x_test)
+        model.ADABoostRegression(run=True, **_ENSEMBLE_KWARGS)
 
         model.ada_reg.to_pickle()
 
-        validate = os.path.exists(str(Path.home()) + "/.aethos/models/ada_reg.pkl")
+        validate = os.path.exists(os.path.join(models_path, "ada_reg.pkl"))
 
         self.assertTrue(validate)
 
     def test_pickle_model_analysis(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
+        models_path, _ = self._use_tmp_dirs()
+        x_train, x_test = _regression_split()
 
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Regression(x_train=data, target="col3")
-        model.ADABoostRegression(random_state=2, run=True)
+        model = Regression(x_train=x_train, target="col3", x_test=x_test)
+        model.ADABoostRegression(run=True, **_ENSEMBLE_KWARGS)
 
         model.to_pickle("ada_reg")
 
-        validate = os.path.exists(str(Path.home()) + "/.aethos/models/ada_reg.pkl")
+        validate = os.path.exists(os.path.join(models_path, "ada_reg.pkl"))
 
         self.assertTrue(validate)
 
     def test_model_create_service(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
+        _, projects_path = self._use_tmp_dirs()
 
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3")
-        model.LogisticRegression(random_state=2, run=True)
+        model = self.classification_models[0.2]
+        model.LogisticRegression(random_state=2, run=True, **_LOG_REG_KWARGS)
 
         model.to_service("log_reg", "test")
+        validate = os.path.exists(
+            os.path.join(projects_path, "test", "app", "log_reg.pkl")
+        )
 
-        self.assertTrue(True)
+        self.assertTrue(validate)
 
     def test_model_analysis_create_service(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        _, projects_path = self._use_tmp_dirs()
 
-        model = Classification(x_train=data, target="col3")
-        m = model.LogisticRegression(random_state=2)
+        model = self.classification_models[0.2]
+        m = model.LogisticRegression(random_state=2, **_LOG_REG_KWARGS)
 
         m.to_service("test1")
+        validate = os.path.exists(
+            os.path.join(projects_path, "test1", "app", "log_reg.pkl")
+        )
 
-        self.assertTrue(True)
+        self.assertTrue(validate)
 
     def test_list_models_empty(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
+        x_train, x_test = _binary_split(0.5)
 
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
 
         model.list_models()
 
@@ -1328,16 +985,14 @@ class TestModelling(unittest.TestCase):
 
     def test_list_models(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
+        x_train, x_test = _binary_split(0.5)
 
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        model = Classification(x_train=x_train, target="col3", x_test=x_test)
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l1", run=False
+            random_state=2, penalty="l2", model_name="l1", run=False, **_LOG_REG_KWARGS
         )
         model.LogisticRegression(
-            random_state=2, penalty="l2", model_name="l2", run=True
+            random_state=2, penalty="l2", model_name="l2", run=True, **_LOG_REG_KWARGS
         )
 
         model.list_models()
@@ -1346,11 +1001,7 @@ class TestModelling(unittest.TestCase):
 
     def test_incorrect_model_name(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        model = self.classification_models[0.5]
 
         self.assertRaises(
             AttributeError,
@@ -1363,11 +1014,7 @@ class TestModelling(unittest.TestCase):
 
     def test_model_debug(self):
 
-        data = np.random.randint(0, 2, size=(500, 3))
-
-        data = pd.DataFrame(data=data, columns=["col1", "col2", "col3"])
-
-        model = Classification(x_train=data, target="col3", test_split_percentage=0.5,)
+        model = self.classification_models[0.5]
 
         model.help_debug()
 
@@ -3,7 +3,7 @@ import multiprocessing as mp
 import os
 import pickle
 import warnings
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 from pathlib import Path
 
 import lightgbm as lgb
@@ -23,6 +23,7 @@ from yellowbrick.model_selection import CVScores, LearningCurve
 
 from aethos.config import EXP_DIR, DEFAULT_MODEL_DIR, IMAGE_DIR, cfg
 from aethos.config.config import _global_config
+from aethos.templates.template_generator import TemplateGenerator as tg
 from aethos.util import _make_dir
 from pickle import dump
 
@@ -219,13 +220,44 @@ def to_pickle(model, name, project=False, project_name=None):
         else:
             path = cfg["models"]["dir"]
     else:
-        path = os.path.join(
-            os.path.expanduser("~"), ".aethos", "projects", project_name, "app"
-        )
+        path = os.path.join(tg.project_dir, project_name, "app")
 
     _make_dir(path)
 
-    pickle.dump(model, open(os.path.join(path, name + ".pkl"), "wb"))
+    with open(os.path.join(path, name + ".pkl"), "wb") as f:
+        pickle.dump(model, f)
+
+
+@lru_cache(maxsize=None)
+def _load_pipeline(task: str, model_type=None):
+    """
+    Loads a pretrained transformers pipeline, once per task and model.
+
+    Building a pipeline loads the model weights from disk (downloading them the
+    first time), so it is reused by every later call with the same arguments.
+    
+    Parameters
+    ----------
+    task : str
+        Pipeline task, e.g. "sentiment-analysis"
+
+    model_type : str, optional
+        Name of the pretrained model, by default the pipeline's default model
+
+    Returns
+    -------
+    Pipeline
+        Transformers pipeline for the task
+    """
+
+    try:
+        from transformers import pipeline
+    except ModuleNotFoundError as e:
+        raise EnvironmentError(
+            "Pre trained model dependencies have not been installed. Please run pip install aethos[ptmodels]"
+        )
+
+    return pipeline(task, model=model_type)
 
 
 def _make_img_project_dir(model_name: str):
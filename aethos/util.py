@@ -319,5 +319,4 @@ def _make_dir(path: str):
         Path of directory or file
     """
 
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
@@ -0,0 +1,50 @@
+import os
+
+# Keep BLAS/OpenMP to one thread per test process. Under pytest-xdist every worker
+# would otherwise start a pool as large as the machine for each tiny fit. This has
+# to happen before numpy is imported.
+for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(var, "1")
+
+import matplotlib
+
+# Render every plot off screen, this has to happen before pyplot is imported.
+matplotlib.use("Agg", force=True)
+
+import matplotlib.pyplot as plt
+import pytest
+
+# Most estimators are imported lazily inside the model methods, load them once per
+# worker up front rather than in whichever test happens to use them first.
+import gensim.models.doc2vec
+import gensim.models.ldamodel
+import gensim.models.word2vec
+import shap
+import sklearn.cluster
+import sklearn.decomposition
+import sklearn.ensemble
+import sklearn.linear_model
+import sklearn.naive_bayes
+import sklearn.svm
+import sklearn.tree
+
+try:
+    # threadpoolctl ships with sklearn >= 0.23, it also limits pools that were
+    # started before the environment variables were read.
+    from threadpoolctl import threadpool_limits
+
+    threadpool_limits(1)
+except ImportError:
+    pass
+
+plt.show = lambda *args, **kwargs: None
+plt.rcParams["figure.max_open_warning"] = 0
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close the figures a test opened so they don't pile up across the session."""
+
+    yield
+
+    plt.close("all")